@@ -1,55 +1,166 @@
-from langchain.llms import OpenAI
+from langchain_openai import ChatOpenAI
 from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
 from langchain.schema import BaseOutputParser
+from openai import OpenAI as OpenAIClient
+from config.settings import (
+    FEEDBACK_MODEL, MAX_PARALLEL, MAX_TOKENS, BATCH_SIZE,
+    FEEDBACK_CACHE_FILE, FEEDBACK_CACHE_SIZE
+)
+from typing import Union
+import asyncio
+import atexit
+import hashlib
 import json
+import os
 import re
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(text: str):
+    """Decode JSON with orjson when it is installed, else the stdlib"""
+    if orjson is not None:
+        return orjson.loads(text.encode())
+    return json.loads(text)
+
+
+_JSON_RE = re.compile(r'\[.*\]|\{.*\}', re.DOTALL)
+# One pass over non-JSON output picks up both "sentiment: ..." and "response: ..." fields
+_FIELD_RE = re.compile(r'(?P<key>sentiment|response)["\s]*:["\s]*(?P<value>[^",\n]+)', re.IGNORECASE)
+
+_POSITIVE_RE = re.compile(r'positive|good|great|excellent', re.IGNORECASE)
+_NEGATIVE_RE = re.compile(r'negative|bad|poor|terrible', re.IGNORECASE)
+
+
+# Reply caches shared by every agent in the process, one per cache file
+_reply_caches = {}
+
+
+def _read_reply_cache(cache_file) -> dict:
+    if cache_file and os.path.exists(cache_file):
+        try:
+            with open(cache_file, encoding='utf-8') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict):
+                return cache
+        except Exception as e:
+            print(f"Could not load feedback cache: {e}")
+    return {}
+
+
+def _get_reply_cache(cache_file) -> dict:
+    """Return the process-wide reply cache for cache_file, loading it on first use"""
+    if cache_file not in _reply_caches:
+        _reply_caches[cache_file] = _read_reply_cache(cache_file)
+    return _reply_caches[cache_file]
+
+
+def save_reply_caches():
+    """Write cached replies to disk, merged with whatever the file holds now"""
+    for cache_file, cache in _reply_caches.items():
+        if not cache_file or not cache:
+            continue
+        # Entries saved by other processes since we loaded are kept; ours win on conflict
+        merged = _read_reply_cache(cache_file)
+        for key in cache:
+            merged.pop(key, None)
+        merged.update(cache)
+        while len(merged) > FEEDBACK_CACHE_SIZE:
+            del merged[next(iter(merged))]
+        try:
+            os.makedirs(os.path.dirname(cache_file) or '.', exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(merged, f)
+        except Exception as e:
+            print(f"Could not save feedback cache: {e}")
+
+
+atexit.register(save_reply_caches)
 
 class SentimentResponseParser(BaseOutputParser):
     """Custom parser for sentiment analysis and response generation"""
     
-    def parse(self, text: str) -> dict:
-        """Parse LLM output to extract sentiment and response"""
+    def parse(self, text: str) -> Union[dict, list]:
+        """
+        Parse LLM output to extract sentiment and response
+        
+        A single JSON object yields a dict; a JSON array, or an object
+        wrapping one under "results" (batched prompt), yields a list with
+        one dict per numbered input. Results recovered without valid JSON
+        carry "fallback": True so callers can avoid caching them.
+        """
         try:
             
-            json_match = re.search(r'\{.*\}', text, re.DOTALL)
+            json_match = _JSON_RE.search(text)
             if json_match:
-                return json.loads(json_match.group())
+                parsed = _json_loads(json_match.group())
+                # JSON mode can't return a bare array, so batched replies arrive as {"results": [...]}
+                if isinstance(parsed, dict) and isinstance(parsed.get("results"), list):
+                    return parsed["results"]
+                return parsed
             
             
-            sentiment_match = re.search(r'sentiment["\s]*:["\s]*([^",\n]+)', text, re.IGNORECASE)
-            response_match = re.search(r'response["\s]*:["\s]*([^",\n]+)', text, re.IGNORECASE)
+            fields = {}
+            for match in _FIELD_RE.finditer(text):
+                fields.setdefault(match.group("key").lower(), match.group("value").strip())
+                if len(fields) == 2:
+                    break
             
-            sentiment = sentiment_match.group(1).strip().lower() if sentiment_match else "neutral"
-            response_text = response_match.group(1).strip() if response_match else "Thank you for your feedback!"
+            sentiment = fields.get("sentiment", "neutral").lower()
+            response_text = fields.get("response", "Thank you for your feedback!")
             
             
-            if "positive" in sentiment or "good" in sentiment or "great" in sentiment:
+            if _POSITIVE_RE.search(sentiment):
                 sentiment = "positive"
-            elif "negative" in sentiment or "bad" in sentiment or "poor" in sentiment:
+            elif _NEGATIVE_RE.search(sentiment):
                 sentiment = "negative"
             else:
                 sentiment = "neutral"
             
             return {
                 "sentiment": sentiment,
-                "response": response_text
+                "response": response_text,
+                "fallback": True
             }
             
         except Exception as e:
             print(f"Parsing error: {e}")
             return {
                 "sentiment": "neutral",
-                "response": "Thank you for your feedback. We appreciate your input!"
+                "response": "Thank you for your feedback. We appreciate your input!",
+                "fallback": True
             }
 
 class FeedbackResponseAgent:
     """Agent for processing customer feedback and generating responses"""
     
-    def __init__(self, temperature=0.7):
+    def __init__(self, temperature=0.7, cache_file=FEEDBACK_CACHE_FILE):
         """Initialize the feedback response agent"""
-        self.llm = OpenAI(temperature=temperature, max_tokens=200)
+        # JSON mode guarantees the reply is a parseable JSON object
+        json_mode = {"response_format": {"type": "json_object"}}
+        self.llm = ChatOpenAI(
+            model=FEEDBACK_MODEL,
+            temperature=temperature,
+            max_tokens=MAX_TOKENS,
+            model_kwargs=json_mode
+        )
+        # Batched prompts answer BATCH_SIZE reviews at once, so budget tokens per review
+        self.batch_llm = ChatOpenAI(
+            model=FEEDBACK_MODEL,
+            temperature=temperature,
+            max_tokens=MAX_TOKENS * BATCH_SIZE,
+            model_kwargs=json_mode
+        )
         self.parser = SentimentResponseParser()
+        # Replies keyed by a hash of the feedback text, so repeated reviews skip the LLM.
+        # Agents using the same cache_file share one cache, saved to disk at exit.
+        self.cache_file = cache_file
+        self._cache = _get_reply_cache(cache_file)
         
         
         self.prompt_template = PromptTemplate(
@@ -61,11 +172,7 @@ You are a customer service AI for SteamNoodles restaurant. Analyze the customer
 
 Customer Feedback: "{feedback}"
 
-Please respond in this exact JSON format:
-{{
-    "sentiment": "positive/negative/neutral",
-    "response": "Your professional response here"
-}}
+Reply with a JSON object with "sentiment" and "response" keys.
 
 Guidelines for responses:
 - For POSITIVE feedback: Thank them warmly, express appreciation, invite them back
@@ -82,6 +189,75 @@ Keep responses concise (1-2 sentences), professional, and personalized to their
             prompt=self.prompt_template,
             output_parser=self.parser
         )
+        
+        
+        self.batch_prompt_template = PromptTemplate(
+            input_variables=["count", "feedback_block"],
+            template="""
+You are a customer service AI for SteamNoodles restaurant. Below are {count} numbered customer reviews.
+For each review, classify the sentiment (positive, negative, or neutral) and write a professional, empathetic response.
+
+Customer Feedback:
+{feedback_block}
+
+Reply with a JSON object whose "results" key is a list with one {{"sentiment", "response"}} object per numbered input, in the same order.
+
+Guidelines for responses:
+- For POSITIVE feedback: Thank them warmly, express appreciation, invite them back
+- For NEGATIVE feedback: Apologize sincerely, acknowledge concerns, offer to make it right
+- For NEUTRAL feedback: Thank them politely, encourage future visits
+
+Keep responses concise (1-2 sentences), professional, and personalized to their specific feedback.
+            """
+        )
+        
+        self.batch_chain = LLMChain(
+            llm=self.batch_llm,
+            prompt=self.batch_prompt_template,
+            output_parser=self.parser
+        )
+    
+    @staticmethod
+    def _format_result(result) -> dict:
+        """Map parsed chain output onto the sentiment/reply format"""
+        if isinstance(result, dict):
+            return {
+                "sentiment": result.get("sentiment", "neutral"),
+                "reply": result.get("response", "Thank you for your feedback!")
+            }
+        return {
+            "sentiment": "neutral",
+            "reply": str(result)
+        }
+    
+    @staticmethod
+    def _is_cacheable(parsed) -> bool:
+        """Only replies parsed from real JSON with both keys are worth reusing"""
+        return (
+            isinstance(parsed, dict)
+            and not parsed.get("fallback")
+            and "sentiment" in parsed
+            and "response" in parsed
+        )
+    
+    @staticmethod
+    def _cache_key(feedback_text: str) -> str:
+        return hashlib.blake2b(feedback_text.strip().encode(), digest_size=16).hexdigest()
+    
+    def _get_cached(self, feedback_text: str):
+        """Return a copy of the cached reply for this feedback, or None"""
+        key = self._cache_key(feedback_text)
+        result = self._cache.pop(key, None)
+        if result is None:
+            return None
+        # Re-insert so the dict stays ordered from least to most recently used
+        self._cache[key] = result
+        return dict(result)
+    
+    def _store_cached(self, feedback_text: str, result: dict):
+        self._cache[self._cache_key(feedback_text)] = dict(result)
+        while len(self._cache) > FEEDBACK_CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
     
     def process_feedback(self, feedback_text: str) -> dict:
         """
@@ -100,21 +276,57 @@ Keep responses concise (1-2 sentences), professional, and personalized to their
                     "reply": "Thank you for taking the time to provide feedback!"
                 }
             
+            cached = self._get_cached(feedback_text)
+            if cached is not None:
+                return cached
             
-            result = self.chain.run(feedback=feedback_text)
+            parsed = self.chain.run(feedback=feedback_text)
+            result = self._format_result(parsed)
+            if self._is_cacheable(parsed):
+                self._store_cached(feedback_text, result)
+            return result
             
-            # Ensure we have the expected format
-            if isinstance(result, dict):
-                return {
-                    "sentiment": result.get("sentiment", "neutral"),
-                    "reply": result.get("response", "Thank you for your feedback!")
-                }
-            else:
+        except Exception as e:
+            print(f"Error processing feedback: {e}")
+            return {
+                "sentiment": "neutral",
+                "reply": "Thank you for your feedback. We appreciate your input and will use it to improve our service!"
+            }
+    
+    async def aprocess_feedback(self, feedback_text: str, semaphore: asyncio.Semaphore = None) -> dict:
+        """
+        Async counterpart of process_feedback
+        
+        Args:
+            feedback_text (str): Customer feedback text
+            semaphore (asyncio.Semaphore): Optional limit on concurrent LLM calls,
+                                           shared between the callers being gathered
+            
+        Returns:
+            dict: Contains sentiment and automated reply
+        """
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(MAX_PARALLEL)
+        
+        try:
+            if not feedback_text.strip():
                 return {
                     "sentiment": "neutral",
-                    "reply": str(result)
+                    "reply": "Thank you for taking the time to provide feedback!"
                 }
-                
+            
+            cached = self._get_cached(feedback_text)
+            if cached is not None:
+                return cached
+            
+            async with semaphore:
+                output = await self.chain.ainvoke({"feedback": feedback_text})
+            parsed = output[self.chain.output_key]
+            result = self._format_result(parsed)
+            if self._is_cacheable(parsed):
+                self._store_cached(feedback_text, result)
+            return result
+            
         except Exception as e:
             print(f"Error processing feedback: {e}")
             return {
@@ -122,6 +334,77 @@ Keep responses concise (1-2 sentences), professional, and personalized to their
                 "reply": "Thank you for your feedback. We appreciate your input and will use it to improve our service!"
             }
     
+    async def _aprocess_chunk(self, semaphore: asyncio.Semaphore, chunk: list) -> list:
+        """Answer a chunk of reviews with a single row-marshaled LLM call"""
+        if len(chunk) == 1:
+            return [await self.aprocess_feedback(chunk[0], semaphore)]
+        
+        feedback_block = "\n".join(
+            f"{i}. {' '.join(feedback.split())}" for i, feedback in enumerate(chunk, 1)
+        )
+        try:
+            async with semaphore:
+                output = await self.batch_chain.ainvoke({
+                    "count": len(chunk),
+                    "feedback_block": feedback_block
+                })
+            results = output[self.batch_chain.output_key]
+            
+            if isinstance(results, list) and len(results) == len(chunk):
+                formatted = []
+                for feedback, parsed in zip(chunk, results):
+                    result = self._format_result(parsed)
+                    if self._is_cacheable(parsed):
+                        self._store_cached(feedback, result)
+                    formatted.append(result)
+                return formatted
+            print(f"Batch response did not match {len(chunk)} reviews, retrying individually")
+            
+        except Exception as e:
+            print(f"Error processing feedback batch: {e}")
+        
+        return await asyncio.gather(*[self.aprocess_feedback(feedback, semaphore) for feedback in chunk])
+    
+    async def abatch_process(self, feedback_list: list) -> list:
+        """
+        Process multiple feedback entries concurrently
+        
+        Non-empty reviews are packed BATCH_SIZE at a time into one prompt,
+        and the resulting chunks are sent in parallel.
+        
+        Args:
+            feedback_list (list): List of feedback texts
+            
+        Returns:
+            list: List of processed results, in input order
+        """
+        semaphore = asyncio.Semaphore(MAX_PARALLEL)
+        
+        # Blank and previously seen entries never reach the LLM
+        responses = [
+            self._get_cached(feedback) if feedback.strip() else self.process_feedback(feedback)
+            for feedback in feedback_list
+        ]
+        pending = [i for i, response in enumerate(responses) if response is None]
+        chunks = [pending[i:i + BATCH_SIZE] for i in range(0, len(pending), BATCH_SIZE)]
+        
+        tasks = [
+            self._aprocess_chunk(semaphore, [feedback_list[i] for i in chunk])
+            for chunk in chunks
+        ]
+        for chunk, chunk_results in zip(chunks, await asyncio.gather(*tasks)):
+            for i, result in zip(chunk, chunk_results):
+                responses[i] = result
+        
+        return [
+            {
+                "original_feedback": feedback,
+                "sentiment": result["sentiment"],
+                "reply": result["reply"]
+            }
+            for feedback, result in zip(feedback_list, responses)
+        ]
+    
     def batch_process(self, feedback_list: list) -> list:
         """
         Process multiple feedback entries at once
@@ -132,9 +415,126 @@ Keep responses concise (1-2 sentences), professional, and personalized to their
         Returns:
             list: List of processed results
         """
+        return asyncio.run(self.abatch_process(feedback_list))
+    
+    def process_feedback_batch(self, reviews: list) -> list:
+        """
+        Process several reviews in one LLM request
+        
+        Reviews are numbered into a single prompt, so up to BATCH_SIZE
+        reviews cost one round-trip; longer lists are split into chunks.
+        
+        Args:
+            reviews (list): List of feedback texts
+            
+        Returns:
+            list: Sentiment and automated reply for each review, index-aligned with the input
+        """
+        return [
+            {"sentiment": result["sentiment"], "reply": result["reply"]}
+            for result in self.batch_process(reviews)
+        ]
+    
+    def batch_process_offline(self, feedback_list: list, wait: bool = True, poll_interval: int = 30):
+        """
+        Process feedback through the OpenAI Batch API
+        
+        Batches are billed at a discount and do not count against the
+        per-request rate limit, but can take up to 24 hours to complete,
+        so this suits backlogs that don't need an immediate reply.
+        
+        Args:
+            feedback_list (list): List of feedback texts
+            wait (bool): Block until the batch finishes
+            poll_interval (int): Seconds between status checks while waiting
+            
+        Returns:
+            list | str: Processed results if wait is True, otherwise the batch id
+                        to pass to retrieve_offline_batch later. Lists with
+                        no non-blank feedback are answered without a batch.
+        """
+        requests = [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.llm.model_name,
+                    "messages": [
+                        {"role": "user", "content": self.prompt_template.format(feedback=feedback)}
+                    ],
+                    "temperature": self.llm.temperature,
+                    "max_tokens": self.llm.max_tokens,
+                    "response_format": {"type": "json_object"}
+                }
+            })
+            for i, feedback in enumerate(feedback_list)
+            if feedback.strip()
+        ]
+        if not requests:
+            # An empty input file would be rejected by batches.create
+            return self._collect_offline_results(feedback_list, {})
+        
+        client = OpenAIClient()
+        batch_file = client.files.create(
+            file=("feedback_batch.jsonl", "\n".join(requests).encode()),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        
+        if not wait:
+            return batch.id
+        return self.retrieve_offline_batch(batch.id, feedback_list, poll_interval)
+    
+    def retrieve_offline_batch(self, batch_id: str, feedback_list: list, poll_interval: int = 30) -> list:
+        """
+        Wait for a Batch API job and collect its results
+        
+        Args:
+            batch_id (str): Id returned by batch_process_offline(wait=False)
+            feedback_list (list): The feedback texts that were submitted
+            poll_interval (int): Seconds between status checks
+            
+        Returns:
+            list: List of processed results, in input order
+        """
+        client = OpenAIClient()
+        batch = client.batches.retrieve(batch_id)
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch_id)
+        
+        if batch.status != "completed":
+            raise Exception(f"Batch {batch_id} ended with status '{batch.status}'")
+        
+        responses = {}
+        if batch.output_file_id:
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                record = _json_loads(line)
+                body = (record.get("response") or {}).get("body") or {}
+                if body.get("choices"):
+                    parsed = self.parser.parse(body["choices"][0]["message"]["content"])
+                    responses[int(record["custom_id"])] = self._format_result(parsed)
+        
+        return self._collect_offline_results(feedback_list, responses)
+    
+    def _collect_offline_results(self, feedback_list: list, responses: dict) -> list:
+        """Pair each input with its batch response, filling in blanks and misses"""
         results = []
-        for feedback in feedback_list:
-            result = self.process_feedback(feedback)
+        for i, feedback in enumerate(feedback_list):
+            if i in responses:
+                result = responses[i]
+            elif not feedback.strip():
+                result = self.process_feedback(feedback)
+            else:
+                result = {
+                    "sentiment": "neutral",
+                    "reply": "Thank you for your feedback. We appreciate your input and will use it to improve our service!"
+                }
             results.append({
                 "original_feedback": feedback,
                 "sentiment": result["sentiment"],
@@ -8,70 +8,156 @@ from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
 from langchain.agents import Tool, AgentExecutor, create_react_agent
 from langchain import hub
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime, timedelta
+from functools import lru_cache
 import re
 import os
 
+# pandas and matplotlib are slow to import, so they load on first use
+pd = None
+plt = None
+
+
+def _import_pandas():
+    global pd
+    if pd is None:
+        import pandas
+        pd = pandas
+
+
+def _import_pyplot():
+    global plt
+    if plt is None:
+        import matplotlib
+        matplotlib.use('Agg')  # plots are only saved to disk, never shown
+        import matplotlib.pyplot as pyplot
+        pyplot.rcParams['path.simplify'] = True
+        pyplot.rcParams['path.simplify_threshold'] = 1.0
+        pyplot.rcParams['agg.path.chunksize'] = 10000
+        plt = pyplot
+
+
+_NUM_RE = re.compile(r'\d+')
+
+# Checked in order; the first unit found in the query wins
+_UNIT_DAYS = {'week': 7, 'month': 30, 'year': 365}
+
+# Comparisons and conditional requests go through the ReAct agent; anything else is a single plot
+_REASONING_RE = re.compile(r'\b(compare|comparison|versus|vs|and then|if|why|explain)\b')
+
+_PLOT_FILE_RE = re.compile(r'outputs/sentiment_analysis_\d+_\d+\.png')
+
+# Bump when ReviewStore changes the columns or dtypes it caches
+_PARQUET_CACHE_VERSION = 'v1'
+
+
+@lru_cache(maxsize=128)
+def _parse_date_range(query_lower: str, today) -> tuple:
+    if "last" in query_lower or "past" in query_lower:
+        match = _NUM_RE.search(query_lower)
+        if match:
+            days = int(match.group())
+            for unit, unit_days in _UNIT_DAYS.items():
+                if unit in query_lower:
+                    days *= unit_days
+                    break
+            return today - timedelta(days=days), today
+
+    # Default: past 7 days
+    return today - timedelta(days=7), today
+
 
 class DateRangeParser:
     """Utility class to parse natural language date ranges"""
 
     @staticmethod
     def parse_date_range(query: str) -> tuple:
-        query_lower = query.lower()
-        today = datetime.now().date()
-
-       
-        if "last" in query_lower or "past" in query_lower:
-            numbers = re.findall(r'\d+', query)
-            if numbers:
-                days = int(numbers[0])
-                if "week" in query_lower:
-                    days *= 7
-                elif "month" in query_lower:
-                    days *= 30
-                elif "year" in query_lower:
-                    days *= 365
-                start_date = today - timedelta(days=days)
-                return start_date, today
-
-        # Default: past 7 days
-        return today - timedelta(days=7), today
+        return _parse_date_range(query.lower(), datetime.now().date())
 
 
-class DataAnalysisTool:
-    """Tool for analyzing sentiment data"""
+class ReviewStore:
+    """Loads the review CSV once so every tool can share the same DataFrame"""
 
     def __init__(self, data_file: str):
         self.data_file = data_file
         self.df = None
+        self.daily_sentiment = None
+        self.mtime = None
         self.load_data()
 
+    @property
+    def cache_file(self) -> str:
+        """Parquet sidecar holding the parsed CSV"""
+        return f"{os.path.splitext(self.data_file)[0]}.{_PARQUET_CACHE_VERSION}.parquet"
+
     def load_data(self):
+        _import_pandas()
         try:
-            self.df = pd.read_csv(self.data_file)
-            self.df['date'] = pd.to_datetime(self.df['date']).dt.date
+            self.mtime = os.path.getmtime(self.data_file)
+            if os.path.exists(self.cache_file) and os.path.getmtime(self.cache_file) >= self.mtime:
+                self.df = pd.read_parquet(self.cache_file)
+            else:
+                self.df = pd.read_csv(self.data_file, engine='pyarrow', parse_dates=['date'])
+                self.df['date'] = self.df['date'].dt.date
+                self.df['sentiment'] = self.df['sentiment'].astype('category')
+                # A sorted date index lets date-range queries slice instead of scanning
+                self.df = self.df.sort_values('date', kind='stable').set_index('date')
+                self.save_cache()
         except Exception as e:
             raise Exception(f"Error loading data: {e}")
 
+        if not self.df.index.is_monotonic_increasing:
+            raise Exception("Error loading data: date index is not sorted")
+
+        # Per-day counts for the whole file; queries slice this instead of regrouping
+        self.daily_sentiment = (
+            self.df.groupby([self.df.index, 'sentiment'], observed=True)
+            .size()
+            .unstack(fill_value=0)
+            .sort_index()
+        )
+
+    def save_cache(self):
+        """Write the parsed data next to the CSV so the next load can skip parsing"""
+        try:
+            self.df.to_parquet(self.cache_file, compression='zstd')
+        except Exception as e:
+            print(f"Could not write data cache: {e}")
+
+    def refresh(self):
+        """Reload the data if the CSV has changed since it was read"""
+        if os.path.getmtime(self.data_file) != self.mtime:
+            self.load_data()
+
+    def get_daily_sentiment(self, start_date, end_date):
+        """Daily sentiment counts between two dates, inclusive"""
+        self.refresh()
+        daily_sentiment = self.daily_sentiment.loc[start_date:end_date]
+        # Drop sentiments with no reviews in this range, as a per-range groupby would
+        return daily_sentiment.loc[:, daily_sentiment.any()]
+
+
+class DataAnalysisTool:
+    """Tool for analyzing sentiment data"""
+
+    def __init__(self, store: ReviewStore):
+        self.store = store
+
     def run(self, query: str) -> str:
         try:
             start_date, end_date = DateRangeParser.parse_date_range(query)
-            mask = (self.df['date'] >= start_date) & (self.df['date'] <= end_date)
-            filtered_df = self.df[mask]
+            daily_sentiment = self.store.get_daily_sentiment(start_date, end_date)
 
-            if filtered_df.empty:
+            if daily_sentiment.empty:
                 return f"No data found for date range {start_date} to {end_date}"
 
-            daily_sentiment = filtered_df.groupby(['date', 'sentiment']).size().unstack(fill_value=0)
-
-            result = f"Date range: {start_date} to {end_date}\n"
-            result += f"Total reviews: {len(filtered_df)}\n"
-            result += f"Daily sentiment breakdown:\n{daily_sentiment.to_string()}"
-            return result
+            parts = [
+                f"Date range: {start_date} to {end_date}",
+                f"Total reviews: {int(daily_sentiment.to_numpy().sum())}",
+                "Daily sentiment breakdown:",
+                daily_sentiment.to_string()
+            ]
+            return "\n".join(parts)
 
         except Exception as e:
             return f"Error analyzing data: {str(e)}"
@@ -80,31 +166,28 @@ class DataAnalysisTool:
 class VisualizationTool:
     """Tool for creating sentiment visualizations"""
 
-    def __init__(self, data_file: str):
-        self.data_file = data_file
-        self.df = None
-        self.load_data()
-
-    def load_data(self):
-        try:
-            self.df = pd.read_csv(self.data_file)
-            self.df['date'] = pd.to_datetime(self.df['date']).dt.date
-        except Exception as e:
-            raise Exception(f"Error loading data: {e}")
+    def __init__(self, store: ReviewStore):
+        self.store = store
+        # Figure and axes are created on first use and cleared between renders
+        self._fig = None
+        self._ax1 = None
+        self._ax2 = None
 
     def run(self, query: str) -> str:
         try:
             start_date, end_date = DateRangeParser.parse_date_range(query)
-            mask = (self.df['date'] >= start_date) & (self.df['date'] <= end_date)
-            filtered_df = self.df[mask]
+            daily_sentiment = self.store.get_daily_sentiment(start_date, end_date)
 
-            if filtered_df.empty:
+            if daily_sentiment.empty:
                 return f"No data found for date range {start_date} to {end_date}"
 
-            plt.figure(figsize=(12, 8))
-            daily_sentiment = filtered_df.groupby(['date', 'sentiment']).size().unstack(fill_value=0)
-
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+            if self._fig is None:
+                _import_pyplot()
+                self._fig, (self._ax1, self._ax2) = plt.subplots(2, 1, figsize=(12, 10))
+            else:
+                self._ax1.clear()
+                self._ax2.clear()
+            ax1, ax2 = self._ax1, self._ax2
 
             daily_sentiment.plot(kind='line', ax=ax1, marker='o')
             ax1.set_title(f'Sentiment Trends Over Time ({start_date} to {end_date})')
@@ -120,13 +203,14 @@ class VisualizationTool:
             ax2.legend(title='Sentiment')
             ax2.tick_params(axis='x', rotation=45)
 
-            plt.tight_layout()
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Layout is fixed up front, so savefig needs no second bbox_inches='tight' pass
+            self._fig.tight_layout()
+            # Microseconds keep back-to-back plots from sharing a filename
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S%f")
             filename = f"sentiment_analysis_{timestamp}.png"
             filepath = os.path.join("outputs", filename)
             os.makedirs("outputs", exist_ok=True)
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
+            self._fig.savefig(filepath, dpi=150)
 
             return f"Visualization saved to {filepath}"
 
@@ -134,35 +218,21 @@ class VisualizationTool:
             return f"Error creating visualization: {str(e)}"
 
 
-class SentimentVisualizationAgent:
-    """Agent for generating sentiment visualizations based on natural language queries"""
-
-    def __init__(self, data_file: str, temperature=0.1):
-        self.data_file = data_file
-        self.llm = OpenAI(temperature=temperature, max_tokens=1000)
+_REACT_PROMPT = None
 
-        self.data_tool = DataAnalysisTool(data_file)
-        self.viz_tool = VisualizationTool(data_file)
 
-        self.tools = [
-            Tool(
-                name="analyze_data",
-                func=self.data_tool.run,
-                description="Analyze sentiment data for a given date range"
-            ),
-            Tool(
-                name="create_plot",
-                func=self.viz_tool.run,
-                description="Create and save sentiment visualization plots"
-            )
-        ]
+def _get_react_prompt():
+    """Fetch the ReAct prompt from the hub once per process"""
+    global _REACT_PROMPT
+    if _REACT_PROMPT is not None:
+        return _REACT_PROMPT
 
-        try:
-            prompt = hub.pull("hwchase17/react")
-        except Exception:
-            prompt = PromptTemplate(
-                input_variables=["tools", "tool_names", "input", "agent_scratchpad"],
-                template="""
+    try:
+        _REACT_PROMPT = hub.pull("hwchase17/react")
+    except Exception:
+        _REACT_PROMPT = PromptTemplate(
+            input_variables=["tools", "tool_names", "input", "agent_scratchpad"],
+            template="""
 You are a data visualization assistant for SteamNoodles restaurant.
 Your job is to analyze sentiment data and create visualizations based on user queries.
 
@@ -183,10 +253,36 @@ Final Answer: the final answer to the original input question
 
 Question: {input}
 {agent_scratchpad}
-                """
+            """
+        )
+    return _REACT_PROMPT
+
+
+class SentimentVisualizationAgent:
+    """Agent for generating sentiment visualizations based on natural language queries"""
+
+    def __init__(self, data_file: str, temperature=0.1):
+        self.data_file = data_file
+        self.llm = OpenAI(temperature=temperature, max_tokens=1000)
+
+        self.store = ReviewStore(data_file)
+        self.data_tool = DataAnalysisTool(self.store)
+        self.viz_tool = VisualizationTool(self.store)
+
+        self.tools = [
+            Tool(
+                name="analyze_data",
+                func=self.data_tool.run,
+                description="Analyze sentiment data for a given date range"
+            ),
+            Tool(
+                name="create_plot",
+                func=self.viz_tool.run,
+                description="Create and save sentiment visualization plots"
             )
+        ]
 
-        self.agent = create_react_agent(self.llm, self.tools, prompt)
+        self.agent = create_react_agent(self.llm, self.tools, _get_react_prompt())
         self.agent_executor = AgentExecutor(
             agent=self.agent,
             tools=self.tools,
@@ -194,15 +290,25 @@ Question: {input}
             max_iterations=3
         )
 
+    @staticmethod
+    def _needs_agent(query: str) -> bool:
+        """Whether a query needs ReAct reasoning rather than a single plot"""
+        return bool(_REASONING_RE.search(query.lower()))
+
     def generate_visualization(self, query: str) -> str:
+        if not self._needs_agent(query):
+            # Plain date-range queries map straight onto the plot tool
+            result = self.viz_tool.run(query)
+            match = _PLOT_FILE_RE.search(result)
+            return match.group() if match else result
+
         try:
             enhanced_query = f"Create a sentiment visualization for: {query}"
             result = self.agent_executor.invoke({"input": enhanced_query})
 
             output = result['output'] if isinstance(result, dict) and 'output' in result else str(result)
 
-            file_pattern = r'outputs/sentiment_analysis_\d+_\d+\.png'
-            match = re.search(file_pattern, output)
+            match = _PLOT_FILE_RE.search(output)
 
             if match:
                 return match.group()
@@ -15,17 +15,22 @@ OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
 # OPENAI_API_KEY = 'your-openai-api-key-here'
 
 # LLM Settings
+FEEDBACK_MODEL = 'gpt-4o-mini'
 DEFAULT_TEMPERATURE = 0.7
 MAX_TOKENS = 200
+MAX_PARALLEL = 16  # concurrent LLM requests in batch_process
+BATCH_SIZE = 8  # reviews packed into a single batch_process prompt
 
 # File Paths
 DATA_DIR = 'data'
 OUTPUT_DIR = 'outputs'
 REVIEWS_FILE = 'restaurant_reviews.csv'
+FEEDBACK_CACHE_FILE = os.path.join(DATA_DIR, 'feedback_cache.json')
+FEEDBACK_CACHE_SIZE = 1024  # most recent replies kept in the cache
 
 # Visualization Settings
 FIGURE_SIZE = (12, 8)
-DPI = 300
+DPI = 150
 PLOT_STYLE = 'seaborn-v0_8'
 
 # Date Range Settings
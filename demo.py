@@ -1,13 +1,52 @@
 #!/usr/bin/env python3
 
+import argparse
 import os
 import sys
+import threading
 import time
 from datetime import datetime
 from agents.feedback_agent import FeedbackResponseAgent
 from agents.visualization_agent import SentimentVisualizationAgent
 from utils.data_generator import generate_sample_data
 
+_print_lock = threading.Lock()
+
+def run_demos(*demos, parallel=True):
+    """
+    Run independent demos, concurrently unless parallel is False
+    
+    Each demo prints an example's block under _print_lock once its work is
+    done, so output appears as it happens without the demos interleaving.
+    
+    Args:
+        demos: (function, args) pairs
+        parallel: run the demos on daemon threads instead of one after another
+    """
+    if not parallel:
+        for func, args in demos:
+            func(*args)
+        return
+    
+    errors = []
+    
+    def run(func, args):
+        try:
+            func(*args)
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=run, args=demo, daemon=True) for demo in demos]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        # Short joins keep Ctrl-C responsive; daemon threads die with the process
+        while thread.is_alive():
+            thread.join(0.1)
+    
+    if errors:
+        raise errors[0]
+
 def print_header(title):
     
     print("\n" + "=" * 60)
@@ -18,12 +57,13 @@ def print_subheader(title):
     
     print(f"\n--- {title} ---")
 
-def demo_feedback_responses():
-    
-    print_header("AGENT 1: CUSTOMER FEEDBACK RESPONSE AGENT")
+def demo_feedback_responses(pace=0.0):
     
-    print("This agent analyzes customer sentiment and generates personalized responses.")
-    print("Processing sample reviews...")
+    with _print_lock:
+        print_header("AGENT 1: CUSTOMER FEEDBACK RESPONSE AGENT")
+        
+        print("This agent analyzes customer sentiment and generates personalized responses.")
+        print("Processing sample reviews...")
     
     agent = FeedbackResponseAgent()
     
@@ -59,28 +99,26 @@ def demo_feedback_responses():
     results = []
     
     for i, case in enumerate(test_cases, 1):
-        print_subheader(f"Example {i}: {case['category']}")
-        print(f"Customer Review:")
-        print(f'"{case["review"]}"')
-        
-       
-        print("\n⏳ Processing...")
         start_time = time.time()
         
         response = agent.process_feedback(case["review"])
         
         processing_time = time.time() - start_time
-        
-        
-        print(f"\n📊 Analysis Results:")
-        print(f"   Sentiment: {response['sentiment'].upper()}")
-        print(f"   Processing Time: {processing_time:.2f} seconds")
-        print(f"\n🤖 Automated Response:")
-        print(f'   "{response["reply"]}"')
-        
-        
         sentiment_match = response['sentiment'] == case['expected_sentiment']
-        print(f"\n✓ Sentiment Classification: {'CORRECT' if sentiment_match else 'UNEXPECTED'}")
+        
+        with _print_lock:
+            print_subheader(f"Example {i}: {case['category']}")
+            print(f"Customer Review:")
+            print(f'"{case["review"]}"')
+            
+            print(f"\n📊 Analysis Results:")
+            print(f"   Sentiment: {response['sentiment'].upper()}")
+            print(f"   Processing Time: {processing_time:.2f} seconds")
+            print(f"\n🤖 Automated Response:")
+            print(f'   "{response["reply"]}"')
+            
+            print(f"\n✓ Sentiment Classification: {'CORRECT' if sentiment_match else 'UNEXPECTED'}")
+            print("-" * 60)
         
         results.append({
             'case': case['category'],
@@ -89,31 +127,31 @@ def demo_feedback_responses():
             'processing_time': processing_time
         })
         
-        print("-" * 60)
-        time.sleep(1)  
+        time.sleep(pace)
     
     
-    print_subheader("Performance Summary")
     correct_predictions = sum(1 for r in results if r['correct'])
     avg_time = sum(r['processing_time'] for r in results) / len(results)
     
-    print(f"Total Test Cases: {len(results)}")
-    print(f"Correct Sentiment Classifications: {correct_predictions}/{len(results)}")
-    print(f"Accuracy: {(correct_predictions/len(results)*100):.1f}%")
-    print(f"Average Processing Time: {avg_time:.2f} seconds")
+    with _print_lock:
+        print_subheader("Performance Summary")
+        print(f"Total Test Cases: {len(results)}")
+        print(f"Correct Sentiment Classifications: {correct_predictions}/{len(results)}")
+        print(f"Accuracy: {(correct_predictions/len(results)*100):.1f}%")
+        print(f"Average Processing Time: {avg_time:.2f} seconds")
 
-def demo_sentiment_visualization():
+def demo_sentiment_visualization(pace=0.0):
     """Demonstrate sentiment visualization with multiple chart types"""
-    print_header("AGENT 2: SENTIMENT VISUALIZATION AGENT")
-    
-    print("This agent creates dynamic visualizations based on natural language queries.")
-    
-    
     data_file = "data/restaurant_reviews.csv"
-    if not os.path.exists(data_file):
-        print("📊 Generating sample dataset...")
-        generate_sample_data(300, 45) 
-        print("✓ Sample data generated")
+    with _print_lock:
+        print_header("AGENT 2: SENTIMENT VISUALIZATION AGENT")
+        
+        print("This agent creates dynamic visualizations based on natural language queries.")
+        
+        if not os.path.exists(data_file):
+            print("📊 Generating sample dataset...")
+            generate_sample_data(300, 45) 
+            print("✓ Sample data generated")
     
     agent = SentimentVisualizationAgent(data_file)
     
@@ -140,47 +178,50 @@ def demo_sentiment_visualization():
     generated_plots = []
     
     for i, test in enumerate(test_queries, 1):
-        print_subheader(f"Visualization {i}: {test['description']}")
-        print(f"Query: '{test['query']}'")
-        
-        print("\n⏳ Processing query and generating visualization...")
         start_time = time.time()
+        summary = plot_path = error = None
         
         try:
            
             summary = agent.get_data_summary(test['query'])
-            print(f"\n📊 Data Summary:")
-            print(summary)
-            
-            
             plot_path = agent.generate_visualization(test['query'])
-            processing_time = time.time() - start_time
+        except Exception as e:
+            error = e
+        processing_time = time.time() - start_time
+        
+        with _print_lock:
+            print_subheader(f"Visualization {i}: {test['description']}")
+            print(f"Query: '{test['query']}'")
             
-            if plot_path and os.path.exists(plot_path):
-                print(f"\n✅ Success!")
-                print(f"   📁 Saved to: {plot_path}")
-                print(f"   ⏱️  Processing time: {processing_time:.2f} seconds")
-                generated_plots.append(plot_path)
+            if error is not None:
+                print(f"\n❌ Error: {str(error)}")
             else:
-                print(f"\n❌ Failed to generate visualization")
+                print(f"\n📊 Data Summary:")
+                print(summary)
                 
-        except Exception as e:
-            print(f"\n❌ Error: {str(e)}")
-        
-        print("-" * 60)
-        time.sleep(1)
-    
+                if plot_path and os.path.exists(plot_path):
+                    print(f"\n✅ Success!")
+                    print(f"   📁 Saved to: {plot_path}")
+                    print(f"   ⏱️  Processing time: {processing_time:.2f} seconds")
+                    generated_plots.append(plot_path)
+                else:
+                    print(f"\n❌ Failed to generate visualization")
+            
+            print("-" * 60)
+        time.sleep(pace)
     
-    print_subheader("Visualization Summary")
-    print(f"Queries Processed: {len(test_queries)}")
-    print(f"Successful Visualizations: {len(generated_plots)}")
-    print(f"Success Rate: {(len(generated_plots)/len(test_queries)*100):.1f}%")
     
-    if generated_plots:
-        print(f"\n📁 Generated Files:")
-        for plot in generated_plots:
-            file_size = os.path.getsize(plot) / 1024  # KB
-            print(f"   • {plot} ({file_size:.1f} KB)")
+    with _print_lock:
+        print_subheader("Visualization Summary")
+        print(f"Queries Processed: {len(test_queries)}")
+        print(f"Successful Visualizations: {len(generated_plots)}")
+        print(f"Success Rate: {(len(generated_plots)/len(test_queries)*100):.1f}%")
+        
+        if generated_plots:
+            print(f"\n📁 Generated Files:")
+            for plot in generated_plots:
+                file_size = os.path.getsize(plot) / 1024  # KB
+                print(f"   • {plot} ({file_size:.1f} KB)")
 
 def demo_integration():
     """Demonstrate integration between both agents"""
@@ -249,6 +290,12 @@ def demo_integration():
 
 def main():
     """Run complete demo"""
+    parser = argparse.ArgumentParser(description="SteamNoodles Multi-Agent Framework demo")
+    parser.add_argument('--pace', type=float, default=0.0,
+                        help="Seconds to pause between examples (e.g. 1 for readable output); "
+                             "runs the demos one after the other")
+    args = parser.parse_args()
+    
     print("🍜 SteamNoodles Multi-Agent Framework")
     print("    Complete System Demonstration")
     print(f"    {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -271,8 +318,13 @@ def main():
     
     
     try:
-        demo_feedback_responses()
-        demo_sentiment_visualization() 
+        # The first two demos share no state, so they run side by side
+        # unless a pace was asked for, in which case one reads after the other
+        run_demos(
+            (demo_feedback_responses, (args.pace,)),
+            (demo_sentiment_visualization, (args.pace,)),
+            parallel=args.pace <= 0
+        )
         demo_integration()
         
         print_header("DEMO COMPLETE")
@@ -3,12 +3,33 @@
 import os
 import sys
 from datetime import datetime, timedelta
-import pandas as pd
-from agents.feedback_agent import FeedbackResponseAgent
-from agents.visualization_agent import SentimentVisualizationAgent
-from utils.data_generator import generate_sample_data
 from config.settings import OPENAI_API_KEY
 
+# Agent and data-generator imports pull in langchain, pandas and matplotlib,
+# so each mode imports only what it uses
+
+DATA_FILE = "data/restaurant_reviews.csv"
+
+# Shared by every mode so the review CSV is parsed at most once per process
+_VIZ_AGENT = None
+
+def _ensure_dataset(path=DATA_FILE):
+    """Generate the sample dataset if it doesn't exist yet and return its path"""
+    if not os.path.exists(path):
+        from utils.data_generator import generate_sample_data
+        print("Generating sample data...")
+        generate_sample_data()
+        print("✓ Sample data generated")
+    return path
+
+def get_viz_agent():
+    """Return the process-wide SentimentVisualizationAgent, creating it on first use"""
+    global _VIZ_AGENT
+    if _VIZ_AGENT is None:
+        from agents.visualization_agent import SentimentVisualizationAgent
+        _VIZ_AGENT = SentimentVisualizationAgent(DATA_FILE)
+    return _VIZ_AGENT
+
 def setup_environment():
     
     if not OPENAI_API_KEY:
@@ -21,6 +42,7 @@ def setup_environment():
     print("✓ Environment setup complete")
 
 def demo_feedback_agent():
+    from agents.feedback_agent import FeedbackResponseAgent
     
     print("\n" + "="*50)
     print("DEMO: FEEDBACK RESPONSE AGENT")
@@ -37,11 +59,13 @@ def demo_feedback_agent():
         "Food took forever to arrive and when it did, it was lukewarm. The server seemed annoyed when I asked about the delay."
     ]
     
-    for i, review in enumerate(sample_reviews, 1):
+    # All five reviews go out in a single request; replies come back in input order
+    responses = agent.process_feedback_batch(sample_reviews)
+    
+    for i, (review, response) in enumerate(zip(sample_reviews, responses), 1):
         print(f"\n--- Sample Review {i} ---")
         print(f"Customer Review: {review}")
         
-        response = agent.process_feedback(review)
         print(f"Sentiment: {response['sentiment']}")
         print(f"Automated Reply: {response['reply']}")
         print("-" * 40)
@@ -52,14 +76,7 @@ def demo_visualization_agent():
     print("DEMO: SENTIMENT VISUALIZATION AGENT")
     print("="*50)
     
-    # Generate sample data if it doesn't exist
-    data_file = "data/restaurant_reviews.csv"
-    if not os.path.exists(data_file):
-        print("Generating sample data...")
-        generate_sample_data()
-        print("✓ Sample data generated")
-    
-    agent = SentimentVisualizationAgent(data_file)
+    agent = get_viz_agent()
     
     # Demo different date range queries
     queries = [
@@ -78,6 +95,7 @@ def demo_visualization_agent():
             print(f"✗ Error generating visualization: {str(e)}")
 
 def interactive_mode():
+    from agents.feedback_agent import FeedbackResponseAgent
     
     print("\n" + "="*50)
     print("INTERACTIVE MODE")
@@ -89,10 +107,8 @@ def interactive_mode():
     # Initialize agents
     feedback_agent = FeedbackResponseAgent()
     
-    data_file = "data/restaurant_reviews.csv"
-    if not os.path.exists(data_file):
-        generate_sample_data()
-    viz_agent = SentimentVisualizationAgent(data_file)
+    viz_agent = get_viz_agent()
+    plot_cache = {}
     
     while True:
         try:
@@ -113,7 +129,12 @@ def interactive_mode():
                 query = input("Enter date range query (e.g., 'last 7 days'): ").strip()
                 if query:
                     try:
-                        plot_path = viz_agent.generate_visualization(query)
+                        # Reuse the plot from an earlier identical query while it still exists
+                        query_key = " ".join(query.lower().split())
+                        plot_path = plot_cache.get(query_key)
+                        if not (plot_path and os.path.exists(plot_path)):
+                            plot_path = viz_agent.generate_visualization(query)
+                            plot_cache[query_key] = plot_path
                         print(f"✓ Visualization saved to: {plot_path}")
                     except Exception as e:
                         print(f"✗ Error: {str(e)}")
@@ -145,8 +166,12 @@ def main():
     os.makedirs("data", exist_ok=True)
     os.makedirs("outputs", exist_ok=True)
     
-    if len(sys.argv) > 1:
-        mode = sys.argv[1].lower()
+    mode = sys.argv[1].lower() if len(sys.argv) > 1 else None
+    # Only the plotting modes read the CSV; feedback mode skips generating it
+    if mode in (None, "demo", "interactive", "viz"):
+        _ensure_dataset()
+    
+    if mode is not None:
         if mode == "demo":
             demo_feedback_agent()
             demo_visualization_agent()
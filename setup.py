@@ -5,7 +5,9 @@ Automates the initial setup process
 """
 
 import os
+import re
 import sys
+import shutil
 import subprocess
 import platform
 
@@ -31,12 +33,51 @@ def create_directory_structure():
     
     print("✓ Directory structure created")
 
+def requirements_satisfied(requirements_file='requirements.txt'):
+    """Check whether every requirement is already installed at its pinned version"""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        return False
+    
+    with open(requirements_file) as f:
+        for line in f:
+            requirement = line.split('#')[0].strip()
+            if not requirement:
+                continue
+            name = re.split(r'[<>=!~;\[\s]', requirement, maxsplit=1)[0]
+            try:
+                installed = version(name)
+            except PackageNotFoundError:
+                return False
+            if '==' in requirement and installed != requirement.split('==', 1)[1].strip():
+                return False
+    return True
+
+def find_uv():
+    """Locate the uv binary, which resolves and installs much faster than pip"""
+    try:
+        import uv
+        return uv.find_uv_bin()
+    except (ImportError, FileNotFoundError):
+        return shutil.which('uv')
+
 def install_dependencies():
     """Install required Python packages"""
     print("Installing dependencies...")
     
     try:
-        subprocess.check_call([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'])
+        if requirements_satisfied():
+            print("✓ Dependencies already installed")
+            return True
+        
+        uv = find_uv()
+        if uv:
+            command = [uv, 'pip', 'install', '--python', sys.executable, '-r', 'requirements.txt']
+        else:
+            command = [sys.executable, '-m', 'pip', 'install', '--no-input',
+                       '--disable-pip-version-check', '-r', 'requirements.txt']
+        subprocess.check_call(command)
         print("✓ Dependencies installed successfully")
     except subprocess.CalledProcessError as e:
         print(f"✗ Error installing dependencies: {e}")
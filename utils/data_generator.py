@@ -3,137 +3,164 @@ Sample Data Generator
 Generates realistic restaurant review data for testing
 """
 
+import numpy as np
 import pandas as pd
-import random
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from datetime import datetime, timedelta
 import os
 
-def generate_sample_data(num_reviews=200, days_back=30):
+_POSITIVE_REVIEWS = (
+    "Absolutely amazing food! The noodles were perfectly cooked and the flavors were incredible.",
+    "Outstanding service and delicious food. Will definitely be back!",
+    "Best noodles in town! The staff was friendly and the atmosphere was great.",
+    "Loved everything about this place. The portions were generous and the taste was fantastic.",
+    "Excellent dining experience. The food arrived quickly and was still hot.",
+    "Great value for money. The noodles were fresh and the service was top-notch.",
+    "Amazing flavors! The chef really knows what they're doing.",
+    "Perfect place for a quick lunch. The food is consistently good.",
+    "Highly recommend the spicy noodles. The ambiance is also very nice.",
+    "Fantastic restaurant! The staff was attentive and the food was delicious.",
+    "The best noodle soup I've ever had. Coming back next week for sure!",
+    "Great food, great service, great prices. What more could you ask for?",
+    "The noodles were cooked to perfection. Loved the variety of toppings.",
+    "Wonderful dining experience. The restaurant is clean and the food is fresh.",
+    "Outstanding quality and fantastic taste. This place never disappoints!"
+)
+
+_NEGATIVE_REVIEWS = (
+    "Terrible experience. The food was cold and the service was slow.",
+    "Very disappointing. The noodles were overcooked and bland.",
+    "Poor service and mediocre food. Won't be coming back.",
+    "The food took forever to arrive and when it did, it was lukewarm.",
+    "Expensive for what you get. The portions were small and tasteless.",
+    "The restaurant was dirty and the staff seemed uninterested.",
+    "Worst noodles I've ever had. The broth was too salty.",
+    "Terrible customer service. The waiters were rude and inattentive.",
+    "The food was greasy and unappetizing. Very disappointing.",
+    "Long wait times and mediocre food. Not worth the money.",
+    "The noodles were mushy and the vegetables were wilted.",
+    "Poor hygiene standards. The tables were dirty and sticky.",
+    "Overpriced and underwhelming. The food lacked flavor completely.",
+    "Bad experience overall. The food was cold and the service was terrible.",
+    "Would not recommend. The quality has really gone downhill."
+)
+
+_NEUTRAL_REVIEWS = (
+    "The food was okay, nothing special but not bad either.",
+    "Average experience. The noodles were decent and the service was fine.",
+    "It's an okay place for a quick meal. Nothing outstanding though.",
+    "The food was alright. Service could be better but it's acceptable.",
+    "Decent noodles but nothing to write home about.",
+    "Average restaurant with average food. It's fine for a casual meal.",
+    "The food was satisfactory. Not great, not terrible.",
+    "It's an okay place. The noodles were decent and the price was fair.",
+    "Nothing special but gets the job done. Food was okay.",
+    "The service was average and the food was standard.",
+    "Decent place for lunch. The noodles were okay, nothing more.",
+    "It's fine. Not the best I've had but not the worst either.",
+    "Average food and service. It's an okay option in the area.",
+    "The noodles were decent. Nothing exceptional but edible.",
+    "Fair enough. The food was okay and the staff was polite."
+)
+
+_VARIATIONS = (
+    " The restaurant atmosphere was pleasant.",
+    " Staff was professional.",
+    " Good location and easy to find.",
+    " Parking was convenient.",
+    " Clean restrooms.",
+    " Music was at a good volume.",
+    ""
+)
+
+# Indexed by sentiment code: 0 = positive, 1 = negative, 2 = neutral
+_SENTIMENTS = np.array(['positive', 'negative', 'neutral'])
+_REVIEW_POOLS = (_POSITIVE_REVIEWS, _NEGATIVE_REVIEWS, _NEUTRAL_REVIEWS)
+_POOL_SIZE = len(_POSITIVE_REVIEWS)  # every pool holds the same number of texts
+
+# Flat lookup tables: the text for (code, row) is at code * _POOL_SIZE + row
+_REVIEW_TEXTS = np.array(_POSITIVE_REVIEWS + _NEGATIVE_REVIEWS + _NEUTRAL_REVIEWS, dtype=object)
+_VARIATION_TEXTS = np.array(_VARIATIONS, dtype=object)
+
+def _generate_reviews_df(num_reviews, days_back, id_offset=0):
     """
-    Generate sample restaurant review data
+    Build a DataFrame of random reviews, sorted by date
     
     Args:
         num_reviews (int): Number of reviews to generate
         days_back (int): Number of days back from today
+        id_offset (int): Number of reviews already issued, so review ids continue from there
         
     Returns:
-        str: Path to generated CSV file
+        pd.DataFrame: Generated reviews
     """
-    
-    
-    positive_reviews = [
-        "Absolutely amazing food! The noodles were perfectly cooked and the flavors were incredible.",
-        "Outstanding service and delicious food. Will definitely be back!",
-        "Best noodles in town! The staff was friendly and the atmosphere was great.",
-        "Loved everything about this place. The portions were generous and the taste was fantastic.",
-        "Excellent dining experience. The food arrived quickly and was still hot.",
-        "Great value for money. The noodles were fresh and the service was top-notch.",
-        "Amazing flavors! The chef really knows what they're doing.",
-        "Perfect place for a quick lunch. The food is consistently good.",
-        "Highly recommend the spicy noodles. The ambiance is also very nice.",
-        "Fantastic restaurant! The staff was attentive and the food was delicious.",
-        "The best noodle soup I've ever had. Coming back next week for sure!",
-        "Great food, great service, great prices. What more could you ask for?",
-        "The noodles were cooked to perfection. Loved the variety of toppings.",
-        "Wonderful dining experience. The restaurant is clean and the food is fresh.",
-        "Outstanding quality and fantastic taste. This place never disappoints!"
-    ]
-    
-    negative_reviews = [
-        "Terrible experience. The food was cold and the service was slow.",
-        "Very disappointing. The noodles were overcooked and bland.",
-        "Poor service and mediocre food. Won't be coming back.",
-        "The food took forever to arrive and when it did, it was lukewarm.",
-        "Expensive for what you get. The portions were small and tasteless.",
-        "The restaurant was dirty and the staff seemed uninterested.",
-        "Worst noodles I've ever had. The broth was too salty.",
-        "Terrible customer service. The waiters were rude and inattentive.",
-        "The food was greasy and unappetizing. Very disappointing.",
-        "Long wait times and mediocre food. Not worth the money.",
-        "The noodles were mushy and the vegetables were wilted.",
-        "Poor hygiene standards. The tables were dirty and sticky.",
-        "Overpriced and underwhelming. The food lacked flavor completely.",
-        "Bad experience overall. The food was cold and the service was terrible.",
-        "Would not recommend. The quality has really gone downhill."
-    ]
-    
-    neutral_reviews = [
-        "The food was okay, nothing special but not bad either.",
-        "Average experience. The noodles were decent and the service was fine.",
-        "It's an okay place for a quick meal. Nothing outstanding though.",
-        "The food was alright. Service could be better but it's acceptable.",
-        "Decent noodles but nothing to write home about.",
-        "Average restaurant with average food. It's fine for a casual meal.",
-        "The food was satisfactory. Not great, not terrible.",
-        "It's an okay place. The noodles were decent and the price was fair.",
-        "Nothing special but gets the job done. Food was okay.",
-        "The service was average and the food was standard.",
-        "Decent place for lunch. The noodles were okay, nothing more.",
-        "It's fine. Not the best I've had but not the worst either.",
-        "Average food and service. It's an okay option in the area.",
-        "The noodles were decent. Nothing exceptional but edible.",
-        "Fair enough. The food was okay and the staff was polite."
-    ]
-    
-    
-    reviews_data = []
+    rng = np.random.default_rng()
     end_date = datetime.now().date()
     start_date = end_date - timedelta(days=days_back)
     
-    for i in range(num_reviews):
-        
-        random_days = random.randint(0, days_back)
-        review_date = start_date + timedelta(days=random_days)
-        
-        
-        sentiment_choice = random.choices(
-            ['positive', 'negative', 'neutral'],
-            weights=[0.5, 0.3, 0.2], 
-            k=1
-        )[0]
-        
-        
-        if sentiment_choice == 'positive':
-            review_text = random.choice(positive_reviews)
-        elif sentiment_choice == 'negative':
-            review_text = random.choice(negative_reviews)
-        else:
-            review_text = random.choice(neutral_reviews)
-        
-        
-        variations = [
-            " The restaurant atmosphere was pleasant.",
-            " Staff was professional.",
-            " Good location and easy to find.",
-            " Parking was convenient.",
-            " Clean restrooms.",
-            " Music was at a good volume.",
-            ""
-        ]
-        
-        if random.random() < 0.3: 
-            review_text += random.choice(variations)
-        
-        reviews_data.append({
-            'date': review_date,
-            'review_text': review_text,
-            'sentiment': sentiment_choice,
-            'review_id': f'R{i+1:04d}',
-            'customer_id': f'C{random.randint(1000, 9999)}'
-        })
+    
+    random_days = rng.integers(0, days_back + 1, size=num_reviews)
+    review_dates = np.datetime64(start_date) + random_days.astype('timedelta64[D]')
     
     
-    df = pd.DataFrame(reviews_data)
+    sentiment_codes = rng.choice(len(_SENTIMENTS), size=num_reviews, p=[0.5, 0.3, 0.2])
+    review_rows = rng.integers(0, _POOL_SIZE, size=num_reviews)
+    review_texts = _REVIEW_TEXTS[sentiment_codes * _POOL_SIZE + review_rows]
     
     
-    df = df.sort_values('date').reset_index(drop=True)
+    variation_mask = rng.random(num_reviews) < 0.3
+    variation_idx = rng.integers(0, len(_VARIATION_TEXTS), size=num_reviews)
+    review_texts = np.where(variation_mask, review_texts + _VARIATION_TEXTS[variation_idx], review_texts)
     
     
+    review_numbers = np.arange(id_offset + 1, id_offset + num_reviews + 1)
+    review_ids = np.char.mod('R%04d', review_numbers)
+    customer_ids = np.char.add('C', rng.integers(1000, 10000, size=num_reviews).astype(str))
+    
+    
+    # Column-oriented construction: each column arrives as a typed array
+    df = pd.DataFrame({
+        'date': pd.to_datetime(review_dates),
+        'review_text': review_texts,
+        'sentiment': pd.Categorical.from_codes(sentiment_codes, categories=_SENTIMENTS),
+        'review_id': review_ids,
+        'customer_id': customer_ids
+    })
+    
+    
+    return df.sort_values('date').reset_index(drop=True)
+
+def _write_csv(df, csv_path, append=False):
+    """Write reviews with pyarrow's native CSV writer, dates as YYYY-MM-DD"""
+    table = pa.Table.from_pandas(df.assign(date=pd.to_datetime(df['date']).dt.date), preserve_index=False)
+    with open(csv_path, 'ab' if append else 'wb') as f:
+        pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(include_header=not append))
+
+def generate_sample_data(num_reviews=200, days_back=30, return_df=False):
+    """
+    Generate sample restaurant review data
+    
+    Args:
+        num_reviews (int): Number of reviews to generate
+        days_back (int): Number of days back from today
+        return_df (bool): Return the DataFrame instead of writing the CSV
+        
+    Returns:
+        str | pd.DataFrame: Path to generated CSV file, or the data if return_df is True
+    """
+    df = _generate_reviews_df(num_reviews, days_back)
+    if return_df:
+        return df
+    
+    end_date = datetime.now().date()
+    start_date = end_date - timedelta(days=days_back)
+    
     os.makedirs('data', exist_ok=True)
     
    
     csv_path = 'data/restaurant_reviews.csv'
-    df.to_csv(csv_path, index=False)
+    _write_csv(df, csv_path)
     
     print(f"Generated {num_reviews} sample reviews")
     print(f"Date range: {start_date} to {end_date}")
@@ -148,11 +175,11 @@ def add_more_reviews(additional_reviews=50):
     csv_path = 'data/restaurant_reviews.csv'
     
     if os.path.exists(csv_path):
-        existing_df = pd.read_csv(csv_path)
-        existing_count = len(existing_df)
+        existing_df = pd.read_csv(csv_path, engine='pyarrow', dtype_backend='pyarrow')
         
-       
-        generate_sample_data(existing_count + additional_reviews, days_back=45)
+        # Only the new rows are generated and appended; existing rows are left untouched
+        new_df = _generate_reviews_df(additional_reviews, 45, id_offset=len(existing_df))
+        _write_csv(new_df, csv_path, append=True)
         print(f"Added {additional_reviews} more reviews to existing dataset")
     else:
         print("No existing dataset found. Generating new dataset...")